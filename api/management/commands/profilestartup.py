@@ -0,0 +1,84 @@
+""" Command to profile startup of the Api app """
+
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Run in a fresh interpreter, so that nothing is imported yet when timing starts.
+PROBE_SCRIPT = """
+import json, os, sys, time
+start = time.perf_counter()
+from wsgiref.util import setup_testing_defaults
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+ready = time.perf_counter()
+environ = {'PATH_INFO': sys.argv[1], 'HTTP_HOST': 'localhost'}
+setup_testing_defaults(environ)
+statuses = []
+body = b''.join(application(environ, lambda status, headers, *args: statuses.append(status)))
+done = time.perf_counter()
+json.dump({
+    'status': statuses[0],
+    'setup_ms': (ready - start) * 1000,
+    'first_request_ms': (done - start) * 1000,
+}, sys.stdout)
+"""
+
+
+def parse_import_times(output):
+    """ Parse `python -X importtime` output into (module, self_us, cumulative_us) tuples """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except (IndexError, ValueError):
+            # header line
+            continue
+        timings.append((fields[2].strip(), self_us, cumulative_us))
+    return timings
+
+
+class Command(BaseCommand):
+    """ Report import time per module and time to first request """
+    help = 'Reports import time per module and time to first request in a fresh process.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/',
+                            help='Path of the first request (default: /).')
+        parser.add_argument('--limit', type=int, default=20,
+                            help='Number of slowest modules to list (default: 20).')
+        parser.add_argument('--budget', type=float,
+                            help='Fail if time to first request exceeds this many milliseconds.')
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', PROBE_SCRIPT, options['path']],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            raise CommandError('Startup probe failed:\n' + result.stderr[-2000:])
+        report = json.loads(result.stdout)
+        timings = parse_import_times(result.stderr)
+
+        self.stdout.write('Settings: {}'.format(settings.SETTINGS_MODULE))
+        self.stdout.write('Modules imported: {}'.format(len(timings)))
+        self.stdout.write('{:>12} {:>12}  {}'.format('self [ms]', 'cumul. [ms]', 'module'))
+        slowest = sorted(timings, key=lambda timing: timing[2], reverse=True)
+        for module, self_us, cumulative_us in slowest[:options['limit']]:
+            self.stdout.write('{:>12.1f} {:>12.1f}  {}'.format(
+                self_us / 1000, cumulative_us / 1000, module))
+        self.stdout.write('Application setup: {:.1f} ms'.format(report['setup_ms']))
+        self.stdout.write('Time to first request: {:.1f} ms ({} {})'.format(
+            report['first_request_ms'], options['path'], report['status']))
+
+        budget = options['budget']
+        if budget is not None and report['first_request_ms'] > budget:
+            raise CommandError('Time to first request {:.1f} ms exceeds budget of {:.1f} ms'.format(
+                report['first_request_ms'], budget))
@@ -1,13 +1,17 @@
 """ Entry App Tests """
 
 from datetime import timedelta
+from io import StringIO
 from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.core.urlresolvers import reverse
 from django.test import TestCase
 from django.utils.timezone import now
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
+from api.management.commands.profilestartup import parse_import_times
 from api.models import Entry
 
 
@@ -281,3 +285,30 @@ class EntryQueryTestCase(TestCase):
         self.assertEqual(len(response.data), 0)
 
         self.client.logout()
+
+
+class ProfileStartupTestCase(TestCase):
+    """ Test suite for the profilestartup command """
+
+    def test_parse_import_times(self):
+        """ Testing parsing of `python -X importtime` output """
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   dateutil._common\n"
+            "import time:      2048 |       4096 | dateutil.parser\n"
+            "Unauthorized: /entries/\n"
+        )
+        self.assertEqual(parse_import_times(output), [
+            ('dateutil._common', 120, 120),
+            ('dateutil.parser', 2048, 4096),
+        ])
+
+    def test_command_reports_startup(self):
+        """ Testing the command reports module import times and first request time """
+        out = StringIO()
+        call_command('profilestartup', limit=5, stdout=out)
+        self.assertIn('Modules imported:', out.getvalue())
+        self.assertIn('Time to first request:', out.getvalue())
+
+        with self.assertRaises(CommandError):
+            call_command('profilestartup', budget=0, stdout=StringIO())
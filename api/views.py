@@ -8,7 +8,6 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from api.serializers import CreateUserSerializer, EntrySerializer, UserSerializer
 from api.models import Entry
-import dateutil.parser
 
 
 class RegistrationAPI(generics.GenericAPIView):
@@ -39,6 +38,8 @@ class EntryViewSet(viewsets.ModelViewSet):
     @action(methods=['GET'], detail=False)
     def get_day_entries(self, request):
         """ Get one day's entries """
+        import dateutil.parser  # pylint: disable=import-outside-toplevel
+
         posted_day = request.GET.get('day')
 
         try:
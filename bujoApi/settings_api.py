@@ -0,0 +1,38 @@
+"""
+API-only Django settings for bujoApi project.
+
+Extends the default settings, dropping the apps and middleware that only
+serve the admin and the browsable API, so that API worker nodes start up
+faster. Select it with DJANGO_SETTINGS_MODULE=bujoApi.settings_api.
+"""
+
+from bujoApi.settings import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+
+# Application definition
+
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'rest_framework',
+    'rest_framework.authtoken',
+    'api'
+]
+
+REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': (
+        'rest_framework.authentication.TokenAuthentication',
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'rest_framework.renderers.JSONRenderer',
+    ),
+}
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+ROOT_URLCONF = 'bujoApi.urls_api'
+
+TEMPLATES = []
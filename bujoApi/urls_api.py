@@ -0,0 +1,16 @@
+"""bujoApi API-only URL Configuration
+
+Used by ``bujoApi.settings_api``. Leaves out the admin site and the
+browsable API login views, which are not installed in that profile.
+"""
+
+from django.urls import include, path
+from rest_framework.authtoken import views
+
+from api.views import RegistrationAPI
+
+urlpatterns = [
+    path("auth/register/", RegistrationAPI.as_view(), name="auth_registration"),
+    path("api-token-auth/", views.obtain_auth_token, name="auth_token"),
+    path("", include("api.urls")),
+]